@@ -5,20 +5,32 @@
  - 添加表格
  - 添加图片
  - 替换文本
+ - 删除文本
 """
+import re
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+
 import docx
 from docx.document import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.oxml.shape import CT_Inline
 from docx.shared import Cm
 from docx.styles.style import (
     _ParagraphStyle,
     _TableStyle,
 )
-from docx.table import _Cell, Table
+from docx.table import _Cell, _Row, Table
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 
 from element import DOCXElement
 
+# 图片尺寸通常只有少数几种，缓存厘米到Emu的换算结果
+_cm = lru_cache(maxsize=64)(Cm)
+
 
 class DocContent(object):
     def __init__(self, doc: str | Document = None):
@@ -29,6 +41,7 @@ class DocContent(object):
         else:
             self.doc = docx.Document()
         self.doc:DocContent
+        self.element = DOCXElement(self.doc)
 
     def add_paragraph(self, text: str, style: _ParagraphStyle = None):
         """
@@ -38,6 +51,9 @@ class DocContent(object):
         :return: 新添加的段落对象
         """
         paragraph = self.doc.add_paragraph(text, style)
+        if self.element.paragraphs is not None:
+            self.element.paragraphs.append(paragraph)
+        self.element.extend_runs(paragraph.runs)
         return paragraph
 
     def insert_paragraph_before(self, text: str, position: Paragraph | int, style: _ParagraphStyle = None) -> Paragraph:
@@ -48,8 +64,9 @@ class DocContent(object):
         :param style: 段落样式
         :return: 插入的段落对象
         """
-        pos_paragraph = DOCXElement(self.doc).get_paragraph(position)
+        pos_paragraph = self.element.get_paragraph(position)
         paragraph = pos_paragraph.insert_paragraph_before(text, style)
+        self.element.clear_cache()
         return paragraph
 
     def append_text_to_paragraph(self, text: str, position: Paragraph | int, style: _ParagraphStyle = None) -> Run:
@@ -60,10 +77,54 @@ class DocContent(object):
         :param style: 段落样式
         :return: run对象
         """
-        paragraph = DOCXElement(self.doc).get_paragraph(position)
+        paragraph = self.element.get_paragraph(position)
         run = paragraph.add_run(text, style)
+        self.element.clear_run_cache()
         return run
 
+    def replace(self, context: dict):
+        """
+        替换文档中的文本，替换在每个run内进行
+        :param context: 替换内容，键为需要被替换的文本，值为替换后的内容
+        :return: None
+        """
+        # 文档可能已被直接修改，每次替换都重新获取run，保证不会漏掉新加入的文本
+        self.element.clear_run_cache()
+        runs = self.element.get_all_runs()
+        texts = [run.text for run in runs]
+        # 所有run的文本用\x00连接成一个字符串，\x00不会出现在文档文本中，匹配不会跨越run
+        haystack = '\x00'.join(texts)
+        # 先过滤掉文档中未出现的键，文档中没有任何占位符时直接返回
+        keys = sorted((key for key in context if key and key in haystack), key=len, reverse=True)
+        if not keys:
+            return
+        pattern = re.compile('|'.join(re.escape(key) for key in keys))
+
+        def repl(match):
+            return str(context[match.group(0)])
+
+        # 对整个字符串只扫描一次，根据每个run的结束位置找出包含匹配的run
+        ends = list(accumulate(len(text) + 1 for text in texts))
+        matched = dict.fromkeys(bisect_right(ends, match.start()) for match in pattern.finditer(haystack))
+        for index in matched:
+            runs[index].text = pattern.sub(repl, texts[index])
+        if matched:
+            self.element.clear_text_index()
+
+    def delete_runs(self, texts: set[str]):
+        """
+        删除文档中文本在texts中的所有run
+        :param texts: 需要删除的run的文本集合
+        :return: None
+        """
+        texts = set(texts)
+        # 文档可能已被直接修改，每次都流式遍历文档，只保留需要删除的run，遍历结束后再从文档中移除
+        deleted = [run for run in self.element.iter_all_runs() if run.text in texts]
+        for run in deleted:
+            run._r.getparent().remove(run._r)
+        if deleted:
+            self.element.clear_run_cache()
+
     def add_picture(self, picture: str, width: float = 15, height: float = None):
         """
         在文章末尾添加图片
@@ -72,7 +133,13 @@ class DocContent(object):
         :param height: 图片高度，单位厘米。默认None：根据宽度自适应
         :return: InlineShape对象
         """
-        self.doc.add_picture(picture, Cm(width), Cm(height) if height else None)
+        # 与Document.add_picture相同，图片放在文档末尾新建的段落中，新段落和run追加到缓存
+        paragraph = self.doc.add_paragraph()
+        run = paragraph.add_run()
+        run.add_picture(picture, _cm(width), _cm(height) if height else None)
+        if self.element.paragraphs is not None:
+            self.element.paragraphs.append(paragraph)
+        self.element.extend_runs([run])
 
     @staticmethod
     def add_picture_after_paragraph(picture: str, paragraph: Paragraph, width: float = 15,
@@ -86,7 +153,7 @@ class DocContent(object):
         :return: InlineShape对象
         """
         run = paragraph.add_run()
-        run.add_picture(picture, Cm(width), Cm(height) if height else None)
+        run.add_picture(picture, _cm(width), _cm(height) if height else None)
 
     def add_picture_in_run(self, picture: str, run: Run | str, width: float = 15, height: int = None):
         """
@@ -98,14 +165,49 @@ class DocContent(object):
         :return: InlineShape对象
         """
         if isinstance(run, str):
-            runs = DOCXElement(self.doc).get_all_runs()
-            for item in runs:
-                if item.text == run:
-                    run = item
-                    break
-            else:
+            runs = self.element.get_runs_by_text(run)
+            if not runs:
+                # 文本可能是在索引建立后直接加入文档的，重建一次索引后再查找
+                self.element.clear_run_cache()
+                runs = self.element.get_runs_by_text(run)
+            if not runs:
                 return
-        run.add_picture(picture, Cm(width), Cm(height) if height else None)
+            run = runs[0]
+        run.add_picture(picture, _cm(width), _cm(height) if height else None)
+
+    def add_pictures(self, context: dict, width: float = 15, height: float = None):
+        """
+        把文本等于键的run替换为对应的图片，每张图片只读取和注册一次
+        :param context: 键为run里的文本，文本建议为全局唯一的文字；值为图片路径
+        :param width: 图片宽度，单位厘米，默认15厘米
+        :param height: 图片高度，单位厘米。默认None：根据宽度自适应
+        :return: None
+        """
+        part = self.doc.part
+        # next_id需要扫描整篇文档的id，批量插入时只取一次，之后顺序递增
+        shape_id = part.next_id
+        inserted = {}
+        refreshed = False
+        for text, picture in context.items():
+            runs = self.element.get_runs_by_text(text)
+            if not runs and not refreshed:
+                # 文本可能是在索引建立后直接加入文档的，每次调用最多重建一次索引
+                self.element.clear_run_cache()
+                refreshed = True
+                runs = self.element.get_runs_by_text(text)
+            if not runs:
+                continue
+            if picture not in inserted:
+                rId, image = part.get_or_add_image(picture)
+                cx, cy = image.scaled_dimensions(_cm(width), _cm(height) if height else None)
+                inserted[picture] = rId, image.filename, cx, cy
+            rId, filename, cx, cy = inserted[picture]
+            for run in runs:
+                run.text = ''
+                run._r.add_drawing(CT_Inline.new_pic_inline(shape_id, rId, filename, cx, cy))
+                shape_id += 1
+        if inserted:
+            self.element.clear_text_index()
 
     @staticmethod
     def add_picture_in_cell(picture: str, cell: _Cell, width: float = 15, height: int = None):
@@ -119,7 +221,7 @@ class DocContent(object):
         """
         last_paragraph = DOCXElement.get_paragraphs_of_cell(cell)[-1]
         run = last_paragraph.add_run()
-        run.add_picture(picture, Cm(width), Cm(height) if height else None)
+        run.add_picture(picture, _cm(width), _cm(height) if height else None)
 
     def add_table(self, rows: int, columns: int, data: list, style: _TableStyle = None):
         """
@@ -133,25 +235,56 @@ class DocContent(object):
         assert rows > 0 and columns > 0, ValueError('表格行数或列数不能小于或者等于0')
         assert len(data) >= rows * columns, ValueError('数据个数应该大于单元格个数')
         table = self.doc.add_table(rows, columns, style)
-        cells = DOCXElement(self.doc).get_cells_of_table(table)
-        for index in range(rows * columns):
-            cells[index].text = data[index]
+        self._fill_cells(table._tbl.iter_tcs(), data)
+        if self.element.tables is not None:
+            self.element.tables.append(table)
+        if self.element.runs is not None:
+            self.element.extend_runs(self.element.get_runs_of_table(table))
         return table
 
-    @staticmethod
-    def append_rows(table: Table, data: list):
+    def append_rows(self, table: Table, data: list):
         """
         在表格后面添加行
         :param table: 表格对象
         :param data: 数据
         :return: None
         """
-        column_length = len(table.rows[0])
-        rows = int(len(data) / column_length)
-        for row in range(rows):
-            row = table.add_row()
-            for index in range(column_length):
-                row.cells[index].text = data[row * column_length + index]
+        tbl = table._tbl
+        grid_cols = tbl.tblGrid.gridCol_lst
+        column_length = len(grid_cols)
+        rows = len(data) // column_length
+        # 所有行共用一个数据迭代器，不为每一行切片复制数据
+        values = iter(data)
+        trs = []
+        for _ in range(rows):
+            tr = OxmlElement('w:tr')
+            for grid_col, text in zip(grid_cols, values):
+                tc = tr.add_tc()
+                if grid_col.w is not None:
+                    tc.width = grid_col.w
+                tc.p_lst[-1].add_r().text = text
+            trs.append(tr)
+        tbl.extend(trs)
+        if self.element.runs is None:
+            return
+        next_element = tbl.getnext()
+        if tbl.getparent() is self.doc.element.body and (next_element is None or next_element.tag == qn('w:sectPr')):
+            # 表格位于文档末尾时，新行的run也位于文档末尾，直接追加到缓存
+            for tr in trs:
+                self.element.extend_runs(self.element.get_runs_of_row(_Row(tr, table)))
+        else:
+            self.element.clear_run_cache()
+
+    @staticmethod
+    def _fill_cells(tcs, data: list):
+        """
+        直接在xml层向空单元格写入文本，避免逐个单元格通过_Cell.text重建内容
+        :param tcs: 单元格xml元素
+        :param data: 数据
+        :return: None
+        """
+        for tc, text in zip(tcs, data):
+            tc.p_lst[-1].add_r().text = text
 
     @staticmethod
     def clear_paragraph(paragraph: Paragraph):
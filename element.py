@@ -2,15 +2,33 @@
 获取文档中的内容元素：
     包含文档中的 paragraph,table,row,column,cell,run
 """
+from itertools import chain
+from typing import Iterator
+
 import docx.document
+from docx.oxml.ns import nsmap, qn
 from docx.text.paragraph import Paragraph
 from docx.text.run import Run
 from docx.table import Table, _Row, _Column, _Cell
+from lxml.etree import XPath, iterwalk
+
+# 预编译的查询，整个遍历在lxml内部完成
+_PARAGRAPH_XPATH = XPath('.//w:p', namespaces={'w': nsmap['w']})
+_RUN_XPATH = XPath('.//w:p/w:r', namespaces={'w': nsmap['w']})
+
+# 表格元素类型到其单元格的映射，按类型直接查表，不再逐个isinstance判断
+_TABLE_ELEMENT_CELLS = {
+    Table: lambda table: table._cells,
+    _Row: lambda row: row.cells,
+    _Column: lambda column: column.cells,
+    _Cell: lambda cell: [cell],
+}
 
 
 class DOCXElement(object):
     def __init__(self, file: str | docx.document.Document):
         """
+        段落、表格和run的查询结果会被缓存，直接修改文档后需要调用clear_cache()
         :param file: 需要获取元素的文档
         """
         if isinstance(file, str):
@@ -21,54 +39,112 @@ class DOCXElement(object):
         self.paragraphs = None
         self.tables = None
         self.runs = None
+        self._run_text_index = None
 
     def get_paragraphs_of_document(self) -> list[Paragraph]:
         """
-        获取文档中的所有段落
+        获取文档中的所有段落，结果会被缓存，直接修改文档后需要调用clear_cache()
         :return: 文档中的所有段落对象
         """
-        self.paragraphs = self.doc.paragraphs
+        if self.paragraphs is None:
+            self.paragraphs = self.doc.paragraphs
         return self.paragraphs
 
     def get_tables_of_document(self) -> list[Table]:
         """
-        获取文档中的所有表格
+        获取文档中的所有表格，结果会被缓存，直接修改文档后需要调用clear_cache()
         :return: 文档中的所有表格对象
         """
-        return self.doc.tables
+        if self.tables is None:
+            self.tables = self.doc.tables
+        return self.tables
 
     def get_all_paragraphs(self) -> list[Paragraph]:
         """
         获取文章中所有的段落对象
         :return: 段落对象列表
         """
-        paragraphs = []
-        paragraphs.extend(self.get_paragraphs_of_document())
-        for table in self.get_tables_of_document():
-            paragraphs.extend(self.get_paragraphs_of_table(table))
-        return paragraphs
+        body = self.doc._body
+        return [Paragraph(p, body) for p in _PARAGRAPH_XPATH(self.doc.element.body)]
+
+    def iter_all_paragraphs(self) -> Iterator[Paragraph]:
+        """
+        按文档顺序逐个生成文档中的段落对象，不构建段落列表
+        :return: 段落对象生成器
+        """
+        body = self.doc._body
+        for _, element in iterwalk(self.doc.element.body, events=('start',), tag=qn('w:p')):
+            yield Paragraph(element, body)
+
+    def iter_all_runs(self) -> Iterator[Run]:
+        """
+        按文档顺序逐个生成文档中的run对象，只对底层xml做一次遍历
+        :return: run对象生成器
+        """
+        p_tag = qn('w:p')
+        elements = (element for _, element in iterwalk(self.doc.element.body, events=('start',), tag=qn('w:r'))
+                    if element.getparent().tag == p_tag)
+        return self._wrap_runs(elements)
+
+    def _wrap_runs(self, elements) -> Iterator[Run]:
+        """
+        将w:r元素包装成run对象，同一段落中的run共用一个段落对象
+        :param elements: 按文档顺序排列的w:r元素
+        :return: run对象生成器
+        """
+        paragraph = None
+        for element in elements:
+            p = element.getparent()
+            if paragraph is None or paragraph._p is not p:
+                paragraph = Paragraph(p, self.doc._body)
+            yield Run(element, paragraph)
 
     def get_all_runs(self) -> list[Run]:
         """
-        获取文本中所有的run对象
+        获取文本中所有的run对象，结果会被缓存，直接修改文档后需要调用clear_cache()
         :return: run对象列表
         """
-        runs = []
-        for paragraph in self.get_all_paragraphs():
-            runs.extend(paragraph.runs)
+        if self.runs is None:
+            self.runs = list(self._wrap_runs(_RUN_XPATH(self.doc.element.body)))
+        return self.runs
+
+    def get_runs_by_text(self, text: str) -> list[Run]:
+        """
+        获取文本内容等于text的所有run，首次调用时建立文本索引
+        :param text: run的文本
+        :return: run对象列表，按文档顺序排列
+        """
+        if self._run_text_index is None:
+            index = {}
+            for run in self.get_all_runs():
+                index.setdefault(run.text, []).append(run)
+            self._run_text_index = index
+        runs = self._run_text_index.get(text, [])
+        if any(run._r.getparent() is None for run in runs):
+            # 去掉已经从文档中移除的run
+            runs = self._run_text_index[text] = [run for run in runs if run._r.getparent() is not None]
         return runs
 
+    def extend_runs(self, runs: list[Run]):
+        """
+        将新添加到文档末尾的run追加到缓存和文本索引中
+        :param runs: 新添加的run对象列表
+        :return: None
+        """
+        if self.runs is not None:
+            self.runs.extend(runs)
+        if self._run_text_index is not None:
+            for run in runs:
+                self._run_text_index.setdefault(run.text, []).append(run)
+
     def get_runs_of_paragraphs(self) -> list[Run]:
         """
         获取文档中所有段落中的run
         :return: 文档中所有段落的所有run对象
         """
-        runs = []
         if self.paragraphs is None:
             self.get_paragraphs_of_document()
-        for paragraph in self.paragraphs:
-            runs.extend(paragraph.runs)
-        return runs
+        return list(chain.from_iterable(paragraph.runs for paragraph in self.paragraphs))
 
     def get_runs_of_paragraph(self, paragraph: int | Paragraph) -> list[Run]:
         """
@@ -107,6 +183,30 @@ class DOCXElement(object):
         assert 0 <= index < len(self.paragraphs), ValueError('段落下标不合规')
         return self.paragraphs[index]
 
+    def clear_cache(self):
+        """
+        清除缓存的段落、表格和run，文档结构被外部修改后调用
+        :return: None
+        """
+        self.paragraphs = None
+        self.tables = None
+        self.clear_run_cache()
+
+    def clear_run_cache(self):
+        """
+        清除缓存的run和run文本索引
+        :return: None
+        """
+        self.runs = None
+        self.clear_text_index()
+
+    def clear_text_index(self):
+        """
+        清除run文本索引，run的文本被修改后调用
+        :return: None
+        """
+        self._run_text_index = None
+
     def get_table(self, table: Table | int) -> Table:
         """
         获取表格对象
@@ -209,10 +309,7 @@ class DOCXElement(object):
         :param cell: 指定单元格对象
         :return: run列表
         """
-        runs = []
-        for paragraph in cls.get_paragraphs_of_cell(cell):
-            runs.extend(paragraph.runs)
-        return runs
+        return list(chain.from_iterable(paragraph.runs for paragraph in cls.get_paragraphs_of_cell(cell)))
 
     @classmethod
     def get_paragraphs_of_table(cls, table: Table) -> list[Paragraph]:
@@ -221,10 +318,8 @@ class DOCXElement(object):
         :param table: 表格对象
         :return: 段落列表
         """
-        paragraphs = []
-        for cell in cls.get_cells_of_table(table):
-            paragraphs.extend(cls.get_paragraphs_of_cell(cell))
-        return paragraphs
+        # 直接遍历表格中的w:tc元素，合并单元格的段落只会出现一次
+        return list(chain.from_iterable(cls.get_paragraphs_of_cell(_Cell(tc, table)) for tc in table._tbl.iter_tcs()))
 
     @classmethod
     def get_runs_of_table(cls, table: Table) -> list[Run]:
@@ -233,10 +328,7 @@ class DOCXElement(object):
         :param table: 表格对象
         :return: run对象列表
         """
-        runs = []
-        for paragraph in cls.get_paragraphs_of_table(table):
-            runs.extend(paragraph.runs)
-        return runs
+        return list(chain.from_iterable(paragraph.runs for paragraph in cls.get_paragraphs_of_table(table)))
 
     @classmethod
     def get_paragraphs_of_row(cls, row: _Row):
@@ -245,10 +337,7 @@ class DOCXElement(object):
         :param row: 行对象
         :return: 单元格对象列表
         """
-        paragraphs = []
-        for cell in cls.get_cells_of_row(row):
-            paragraphs.extend(cell.paragraphs)
-        return paragraphs
+        return list(chain.from_iterable(cell.paragraphs for cell in cls.get_cells_of_row(row)))
 
     @classmethod
     def get_paragraphs_of_column(cls, column: _Column):
@@ -257,10 +346,7 @@ class DOCXElement(object):
         :param column: 列对象
         :return: 单元格对象列表
         """
-        paragraphs = []
-        for cell in cls.get_cells_of_column(column):
-            paragraphs.extend(cell.paragraphs)
-        return paragraphs
+        return list(chain.from_iterable(cell.paragraphs for cell in cls.get_cells_of_column(column)))
 
     def get_runs_of_column(self, column: _Column) -> list[Run]:
         """
@@ -268,10 +354,7 @@ class DOCXElement(object):
         :param column: 列对象
         :return: run对象列表
         """
-        runs = []
-        for paragraph in self.get_paragraphs_of_column(column):
-            runs.extend(paragraph.runs)
-        return runs
+        return list(chain.from_iterable(paragraph.runs for paragraph in self.get_paragraphs_of_column(column)))
 
     def get_runs_of_row(self, row: _Row) -> list[Run]:
         """
@@ -279,10 +362,7 @@ class DOCXElement(object):
         :param row: 行对象
         :return: run对象列表
         """
-        runs = []
-        for paragraph in self.get_paragraphs_of_row(row):
-            runs.extend(paragraph.runs)
-        return runs
+        return list(chain.from_iterable(paragraph.runs for paragraph in self.get_paragraphs_of_row(row)))
 
     @classmethod
     def get_cells_of_table_element(cls, element: _Row | _Column | Table | _Cell) -> list[_Cell]:
@@ -291,12 +371,8 @@ class DOCXElement(object):
         :param element: 表格元素对象
         :return: 单元格列表
         """
-        if isinstance(element, Table):
-            return element._cells()
-        elif isinstance(element, _Cell):
-            return [element]
-        else:
-            return element.cells
+        get_cells = _TABLE_ELEMENT_CELLS.get(type(element))
+        return get_cells(element) if get_cells else element.cells
 
     @classmethod
     def get_paragraphs_of_table_element(cls, element: _Row | _Column | Table | _Cell) -> list[Paragraph]:
@@ -305,10 +381,7 @@ class DOCXElement(object):
         :param element: 表格元素对象
         :return: 段落对象列表
         """
-        paragraphs = []
-        for cell in cls.get_cells_of_table_element(element):
-            paragraphs.extend(cell.paragraphs)
-        return paragraphs
+        return list(chain.from_iterable(cell.paragraphs for cell in cls.get_cells_of_table_element(element)))
 
     @classmethod
     def get_runs_in_table_element(cls, element: _Row | _Column | Table | _Cell) -> list[Run]:
@@ -317,7 +390,4 @@ class DOCXElement(object):
         :param element: 表格元素对象
         :return: run对象列表
         """
-        runs = []
-        for paragraph in cls.get_paragraphs_of_table_element(element):
-            runs.extend(paragraph.runs)
-        return runs
+        return list(chain.from_iterable(paragraph.runs for paragraph in cls.get_paragraphs_of_table_element(element)))
@@ -30,7 +30,15 @@ Paragraph:
  - 修改Cell内容对齐方式
  - 修改Cell字体字号颜色
 """
-__all__ = ['DocStyle']
+__all__ = ['DocStyle', 'RunStyleSpec', 'P_CENTER', 'P_LEFT', 'P_RIGHT', 'T_CENTER', 'T_LEFT', 'T_RIGHT']
+
+import sys
+from copy import deepcopy
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable
+from weakref import WeakKeyDictionary
 
 import docx
 from docx.document import Document
@@ -39,13 +47,228 @@ from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
 from docx.shared import Pt, RGBColor
 from docx.table import Table, _Row, _Column, _Cell
 from docx.text.paragraph import Paragraph
+from docx.oxml import OxmlElement
 from docx.oxml.ns import qn
+from docx.oxml.simpletypes import ST_TwipsMeasure
 from docx.styles.style import (
     _ParagraphStyle,
     _TableStyle,
 )
 from docx.text.run import Run
-from element import DOCXElement
+from lxml.etree import XPath
+from element import _PARAGRAPH_XPATH, _RUN_XPATH
+
+
+# 段落对齐方式
+P_CENTER = WD_PARAGRAPH_ALIGNMENT.CENTER
+P_LEFT = WD_PARAGRAPH_ALIGNMENT.LEFT
+P_RIGHT = WD_PARAGRAPH_ALIGNMENT.RIGHT
+
+# 表格对齐方式
+T_CENTER = WD_TABLE_ALIGNMENT.CENTER
+T_LEFT = WD_TABLE_ALIGNMENT.LEFT
+T_RIGHT = WD_TABLE_ALIGNMENT.RIGHT
+
+_QN_CACHE: dict[str, str] = {}
+
+
+def _qn(name: str) -> str:
+    """
+    带缓存的qn，同一个带前缀的名字只解析一次
+    :param name: 带命名空间前缀的名字，例如 w:eastAsia
+    :return: Clark格式的完整名字
+    """
+    try:
+        return _QN_CACHE[name]
+    except KeyError:
+        value = _QN_CACHE[name] = qn(name)
+        return value
+
+
+# 设置run字体时用到的xml属性名，模块加载时解析一次
+_QN_ASCII = _qn('w:ascii')
+_QN_HANSI = _qn('w:hAnsi')
+_QN_R = _qn('w:r')
+_QN_BEFORE = _qn('w:before')
+_QN_AFTER = _qn('w:after')
+
+# 默认字体，作为各方法参数的默认值，默认参数时可以用is直接判断
+_DEFAULT_EN_FONT = sys.intern('w:eastAsia')
+_DEFAULT_ZH_FONT = sys.intern('微软雅黑')
+_DEFAULT_FONT_NAMES = (_QN_ASCII, _QN_HANSI, _qn(_DEFAULT_EN_FONT))
+
+# 批量修改样式时字号和颜色通常只有少数几种，缓存这些不可变对象
+_pt = lru_cache(maxsize=128)(Pt)
+_rgb = lru_cache(maxsize=256)(RGBColor)
+_rgb_from_string = lru_cache(maxsize=256)(RGBColor.from_string)
+
+
+@lru_cache(maxsize=128)
+def _twips(points: float) -> str:
+    """
+    把磅值换算为w:spacing属性中使用的缇值字符串，相同的磅值只换算一次。
+    与paragraph_format相同经过ST_TwipsMeasure校验，负数会抛出ValueError
+    :param points: 磅值
+    :return: 缇值字符串
+    """
+    return ST_TwipsMeasure.to_xml(Pt(points))
+
+
+def _to_rgb(color: tuple | str | None) -> RGBColor | None:
+    """
+    把颜色统一转换为RGBColor对象
+    :param color: 颜色，颜色为三元组，格式为(r,g,b)
+        或者 一个十六进制的颜色字符串，例如：3C2F80
+    :return: RGBColor对象，color为None时返回None
+    """
+    if color is None or isinstance(color, RGBColor):
+        return color
+    if isinstance(color, tuple):
+        r, g, b = color
+        return _rgb(r, g, b)
+    return _rgb_from_string(color)
+
+
+@dataclass(frozen=True, slots=True)
+class RunStyleSpec(object):
+    """
+    run样式描述，字段含义与DocStyle.set_run_attribute的参数相同。
+    对象不可变且可哈希，相同的样式描述共用生成好的修改操作和w:rPr
+    """
+    en_font: str = _DEFAULT_EN_FONT
+    zh_font: str = _DEFAULT_ZH_FONT
+    font_size: float = None
+    color: tuple | str = None
+    bold: bool = None
+    italic: bool = None
+
+    def __post_init__(self):
+        # 颜色在创建时统一为RGBColor，(r,g,b)和十六进制字符串表示的同一颜色共用缓存
+        object.__setattr__(self, 'color', _to_rgb(self.color))
+
+
+@lru_cache(maxsize=256)
+def _run_attribute_ops(spec: RunStyleSpec) -> tuple:
+    """
+    根据样式描述预先生成对w:rPr的修改操作，字号颜色等只计算一次，
+    批量修改run时每个run只需依次执行这些操作，不再重复判断和创建对象
+    :param spec: run样式描述
+    :return: 操作元组，每个操作接收一个w:rPr元素；没有需要修改的属性时为空元组
+    """
+    ops = []
+    if spec.zh_font is not None:
+        zh_font = spec.zh_font
+        if spec.en_font is _DEFAULT_EN_FONT:
+            font_names = _DEFAULT_FONT_NAMES
+        elif spec.en_font is None:
+            font_names = (_QN_ASCII, _QN_HANSI)
+        else:
+            font_names = (_QN_ASCII, _QN_HANSI, _qn(spec.en_font))
+
+        def set_fonts(rPr):
+            rFonts = rPr.get_or_add_rFonts()
+            for name in font_names:
+                rFonts.set(name, zh_font)
+        ops.append(set_fonts)
+    if spec.font_size is not None:
+        size = _pt(spec.font_size)
+
+        def set_size(rPr):
+            rPr.sz_val = size
+        ops.append(set_size)
+    if spec.color is not None:
+        rgb = spec.color
+
+        def set_color(rPr):
+            rPr._remove_color()
+            rPr.get_or_add_color().val = rgb
+        ops.append(set_color)
+    if spec.bold is not None:
+        bold = spec.bold
+
+        def set_bold(rPr):
+            rPr.get_or_add_b().val = bold
+        ops.append(set_bold)
+    if spec.italic is not None:
+        italic = spec.italic
+
+        def set_italic(rPr):
+            rPr.get_or_add_i().val = italic
+        ops.append(set_italic)
+    return tuple(ops)
+
+
+@lru_cache(maxsize=256)
+def _rpr_template(spec: RunStyleSpec):
+    """
+    生成只包含样式描述中属性的w:rPr元素，作为模板复制到没有w:rPr的run中，模板本身不会插入文档
+    :param spec: run样式描述
+    :return: w:rPr元素
+    """
+    template = OxmlElement('w:rPr')
+    for op in _run_attribute_ops(spec):
+        op(template)
+    return template
+
+
+def _rpr_signature(rPr) -> tuple:
+    """
+    w:rPr的结构签名，由子元素的标签和属性组成，不受命名空间声明影响
+    :param rPr: w:rPr元素
+    :return: 签名元组
+    """
+    return tuple((child.tag, tuple(child.attrib.items())) for child in rPr)
+
+
+@lru_cache(maxsize=256)
+def _rpr_template_signature(spec: RunStyleSpec) -> tuple:
+    """
+    w:rPr模板的结构签名，用于判断run的w:rPr是否已经是目标样式
+    :param spec: run样式描述
+    :return: 签名元组
+    """
+    return _rpr_signature(_rpr_template(spec))
+
+
+def _apply_run_style(r_elements, spec: RunStyleSpec):
+    """
+    把样式应用到每个w:r元素上。
+    没有w:rPr的run直接插入缓存的w:rPr模板副本；已有w:rPr的run在原有属性上逐项修改，保留其他属性；
+    w:rPr与模板完全相同的run（例如重复设置同一样式）直接跳过
+    :param r_elements: w:r元素
+    :param spec: run样式描述，没有需要修改的属性时直接返回
+    :return: None
+    """
+    ops = _run_attribute_ops(spec)
+    if not ops:
+        return
+    template = _rpr_template(spec)
+    signature = None
+    for r in r_elements:
+        rPr = r.rPr
+        if rPr is None:
+            r.insert(0, deepcopy(template))
+            continue
+        if len(rPr) == len(template):
+            if signature is None:
+                signature = _rpr_template_signature(spec)
+            if _rpr_signature(rPr) == signature:
+                continue
+        for op in ops:
+            op(rPr)
+
+
+def _query_table_element(element: Table | _Row | _Column | _Cell, xpath: XPath) -> list:
+    """
+    在表格元素的xml上执行预编译的查询
+    :param element: 表格元素对象,包含 表格，行，列，单元格
+    :param xpath: 预编译的XPath查询
+    :return: 查询到的元素列表
+    """
+    if isinstance(element, _Column):
+        # 列在xml中没有对应的元素，分别查询列中的每个单元格
+        return list(chain.from_iterable(xpath(cell._tc) for cell in element.cells))
+    return xpath(element._element)
 
 
 class DocStyle(object):
@@ -53,15 +276,17 @@ class DocStyle(object):
     修改文档元素的样式
     """
 
-    # 段落对齐方式
-    P_CENTER = WD_PARAGRAPH_ALIGNMENT.CENTER
-    P_LEFT = WD_PARAGRAPH_ALIGNMENT.LEFT
-    P_RIGHT = WD_PARAGRAPH_ALIGNMENT.RIGHT
+    # 对齐方式，与模块级常量相同，保留类属性的访问方式
+    P_CENTER = P_CENTER
+    P_LEFT = P_LEFT
+    P_RIGHT = P_RIGHT
+
+    T_CENTER = T_CENTER
+    T_LEFT = T_LEFT
+    T_RIGHT = T_RIGHT
 
-    # 表格对齐方式
-    T_CENTER = WD_TABLE_ALIGNMENT.CENTER
-    T_LEFT = WD_TABLE_ALIGNMENT.LEFT
-    T_RIGHT = WD_TABLE_ALIGNMENT.RIGHT
+    # 段落样式的字号缓存，{文档部件: {样式id: 字号}}，避免每次沿样式继承链查找
+    _style_size_cache = WeakKeyDictionary()
 
     def __init__(self, doc: str | Document):
         if isinstance(doc, str):
@@ -70,7 +295,8 @@ class DocStyle(object):
             self.doc = doc
 
     @classmethod
-    def set_paragraph_attributes(cls, paragraph: Paragraph, en_font: str = 'w:eastAsia', zh_font: str = '微软雅黑',
+    def set_paragraph_attributes(cls, paragraph: Paragraph, en_font: str = _DEFAULT_EN_FONT,
+                                 zh_font: str = _DEFAULT_ZH_FONT,
                                  font_size: float = None, color: tuple | str = None,
                                  bold: bool = None, italic: bool = None) -> Paragraph:
         """
@@ -85,8 +311,9 @@ class DocStyle(object):
         :param italic: 是否倾斜
         :return:修改后的段落对象
         """
-        for run in paragraph.runs:
-            cls.set_run_attribute(run, en_font, zh_font, font_size, color, bold, italic)
+        spec = RunStyleSpec(en_font, zh_font, font_size, color, bold, italic)
+        # 直接遍历段落中的w:r元素，不为每个run创建Run对象
+        _apply_run_style(paragraph._p.iterchildren(_QN_R), spec)
         return paragraph
 
     @staticmethod
@@ -111,16 +338,19 @@ class DocStyle(object):
         paragraph.alignment = alignment
         return paragraph
 
-    @staticmethod
-    def set_paragraph_indent(paragraph: Paragraph, indent_num: int) -> Paragraph:
+    @classmethod
+    def set_paragraph_indent(cls, paragraph: Paragraph, indent_num: int) -> Paragraph:
         """
-        设置段落首行缩进
+        设置段落首行缩进，样式的字号在同一文档中只解析一次
         :param paragraph: 短路对象
         :param indent_num: 所经的字符数
         :return: 修改后的段落
         """
-        paragraph.paragraph_format.first_line_indent = \
-            paragraph.style.font.size * indent_num
+        sizes = cls._style_size_cache.setdefault(paragraph.part, {})
+        style_id = paragraph._p.style
+        if style_id not in sizes:
+            sizes[style_id] = paragraph.style.font.size
+        paragraph.paragraph_format.first_line_indent = sizes[style_id] * indent_num
         return paragraph
 
     @staticmethod
@@ -133,14 +363,31 @@ class DocStyle(object):
         :param after_space: 行后距，单位磅
         :return: 修改后的段落对象
         """
-        if before_space is not None:
-            paragraph.paragraph_format.space_before = Pt(before_space)
-        if after_space is not None:
-            paragraph.paragraph_format.space_after = Pt(after_space)
+        if before_space is None and after_space is None:
+            return paragraph
+        # 先换算并校验，数值不合法时不修改段落
+        before = None if before_space is None else _twips(before_space)
+        after = None if after_space is None else _twips(after_space)
+        # 直接写入w:spacing的属性，不经过paragraph_format的描述符和单位转换
+        spacing = paragraph._p.get_or_add_pPr().get_or_add_spacing()
+        if before is not None:
+            spacing.set(_QN_BEFORE, before)
+        if after is not None:
+            spacing.set(_QN_AFTER, after)
         return paragraph
 
     @staticmethod
-    def set_run_attribute(run: Run, en_font: str = 'w:eastAsia', zh_font: str = '微软雅黑',
+    def apply_run_spec(runs: Iterable[Run], spec: RunStyleSpec):
+        """
+        把同一个样式批量应用到多个run上，字号、颜色、w:rPr等只在第一次使用该样式时生成
+        :param runs: run对象，可以是任意可迭代对象
+        :param spec: run样式描述
+        :return: None
+        """
+        _apply_run_style((run._r for run in runs), spec)
+
+    @classmethod
+    def set_run_attribute(cls, run: Run, en_font: str = _DEFAULT_EN_FONT, zh_font: str = _DEFAULT_ZH_FONT,
                           font_size: float = None, color: tuple | str = None,
                           bold: bool = None, italic: bool = None) -> Run:
         """
@@ -155,21 +402,7 @@ class DocStyle(object):
         :param italic: 是否倾斜
         :return: 修改后的run对象
         """
-        if en_font is not None or zh_font is not None:
-            run.font.name = zh_font
-            run._element.rPr.rFonts.set(qn(en_font), zh_font)
-        if font_size is not None:
-            run.font.size = Pt(font_size)
-        if color is not None:
-            if isinstance(color, tuple):
-                r, g, b = color
-                run.font.color = RGBColor(r, g, b)
-            else:
-                run.font.color = RGBColor.from_string(color)
-        if bold is not None:
-            run.bold = bold
-        if italic is not None:
-            run.italic = italic
+        cls.apply_run_spec((run,), RunStyleSpec(en_font, zh_font, font_size, color, bold, italic))
         return run
 
     @staticmethod
@@ -213,14 +446,14 @@ class DocStyle(object):
         :param alignment: 对齐方式
         :return: 修改后的表格
         """
-        paragraphs = DOCXElement.get_paragraphs_of_table(element)
-        for paragraph in paragraphs:
-            cls.set_paragraph_alignment(paragraph, alignment)
+        for p in _query_table_element(element, _PARAGRAPH_XPATH):
+            p.get_or_add_pPr().jc_val = alignment
         return element
 
     @classmethod
-    def set_table_element_content_attribute(cls, element: Table | _Row | _Column | _Cell, en_font: str = 'w:eastAsia',
-                                            zh_font: str = '微软雅黑',
+    def set_table_element_content_attribute(cls, element: Table | _Row | _Column | _Cell,
+                                            en_font: str = _DEFAULT_EN_FONT,
+                                            zh_font: str = _DEFAULT_ZH_FONT,
                                             font_size: float = None, color: tuple | str = None,
                                             bold: bool = None, italic: bool = None) -> Table:
         """
@@ -235,249 +468,94 @@ class DocStyle(object):
         :param italic: 是否倾斜
         :return: 修改后的表格对象
         """
-        runs = DOCXElement.get_runs_in_table_element(element)
-        for run in runs:
-            cls.set_run_attribute(run, en_font, zh_font, font_size, color, bold, italic)
+        spec = RunStyleSpec(en_font, zh_font, font_size, color, bold, italic)
+        if _run_attribute_ops(spec):
+            _apply_run_style(_query_table_element(element, _RUN_XPATH), spec)
         return element
 
 
+# 样式名称表，StyleName中的属性由这里的名称生成，属性名为名称中的空格替换为下划线
+# 表格样式按系列给出，每个系列包含基础样式和 Accent 1 ~ Accent 6 六个变体
+_TABLE_STYLE_FAMILIES = (
+    "Light Shading",
+    "Light List",
+    "Light Grid",
+    "Medium Shading 1",
+    "Medium Shading 2",
+    "Medium List 1",
+    "Medium List 2",
+    "Medium Grid 1",
+    "Medium Grid 2",
+    "Medium Grid 3",
+    "Dark List",
+    "Colorful Shading",
+    "Colorful List",
+    "Colorful Grid",
+)
+
+_TABLE_STYLE_NAMES = ("Normal Table", "Table Grid") + tuple(
+    name
+    for family in _TABLE_STYLE_FAMILIES
+    for name in (family, *(f"{family} Accent {accent}" for accent in range(1, 7)))
+)
+
+# 段落样式名称包含全部表格样式名称，两个类共用同一组字符串
+_PARAGRAPH_ONLY_STYLE_NAMES = (
+    "Normal",
+    "Header",
+    "Footer",
+    "Heading 1",
+    "Heading 2",
+    "Heading 3",
+    "Heading 4",
+    "Heading 5",
+    "Heading 6",
+    "Heading 7",
+    "Heading 8",
+    "Heading 9",
+    "No Spacing",
+    "Title",
+    "Subtitle",
+    "List Paragraph",
+    "Body Text",
+    "Body Text 2",
+    "Body Text 3",
+    "List",
+    "List 2",
+    "List 3",
+    "List Bullet",
+    "List Bullet 2",
+    "List Bullet 3",
+    "List Number",
+    "List Number 2",
+    "List Number 3",
+    "List Continue",
+    "List Continue 2",
+    "List Continue 3",
+    "macro",
+    "Quote",
+    "Caption",
+    "Intense Quote",
+    "TOC Heading",
+)
+
+_PARAGRAPH_STYLE_NAMES = _PARAGRAPH_ONLY_STYLE_NAMES + _TABLE_STYLE_NAMES
+
+
+def _style_name_class(class_name: str, style_names: tuple) -> type:
+    """
+    根据样式名称生成样式名称类
+    :param class_name: 类名
+    :param style_names: 样式名称
+    :return: 以样式名称为属性的类
+    """
+    attributes = {}
+    for style_name in style_names:
+        style_name = sys.intern(style_name)
+        attributes[style_name.replace(' ', '_')] = style_name
+    return type(class_name, (object,), attributes)
+
+
 class StyleName(object):
-    class ParagraphStyle(object):
-        Normal = "Normal"
-        Header = "Header"
-        Footer = "Footer"
-        Heading_1 = "Heading 1"
-        Heading_2 = "Heading 2"
-        Heading_3 = "Heading 3"
-        Heading_4 = "Heading 4"
-        Heading_5 = "Heading 5"
-        Heading_6 = "Heading 6"
-        Heading_7 = "Heading 7"
-        Heading_8 = "Heading 8"
-        Heading_9 = "Heading 9"
-        Normal_Table = "Normal Table"
-        No_Spacing = "No Spacing"
-        Title = "Title"
-        Subtitle = "Subtitle"
-        List_Paragraph = "List Paragraph"
-        Body_Text = "Body Text"
-        Body_Text_2 = "Body Text 2"
-        Body_Text_3 = "Body Text 3"
-        List = "List"
-        List_2 = "List 2"
-        List_3 = "List 3"
-        List_Bullet = "List Bullet"
-        List_Bullet_2 = "List Bullet 2"
-        List_Bullet_3 = "List Bullet 3"
-        List_Number = "List Number"
-        List_Number_2 = "List Number 2"
-        List_Number_3 = "List Number 3"
-        List_Continue = "List Continue"
-        List_Continue_2 = "List Continue 2"
-        List_Continue_3 = "List Continue 3"
-        macro = "macro"
-        Quote = "Quote"
-        Caption = "Caption"
-        Intense_Quote = "Intense Quote"
-        TOC_Heading = "TOC Heading"
-        Table_Grid = "Table Grid"
-        Light_Shading = "Light Shading"
-        Light_Shading_Accent_1 = "Light Shading Accent 1"
-        Light_Shading_Accent_2 = "Light Shading Accent 2"
-        Light_Shading_Accent_3 = "Light Shading Accent 3"
-        Light_Shading_Accent_4 = "Light Shading Accent 4"
-        Light_Shading_Accent_5 = "Light Shading Accent 5"
-        Light_Shading_Accent_6 = "Light Shading Accent 6"
-        Light_List = "Light List"
-        Light_List_Accent_1 = "Light List Accent 1"
-        Light_List_Accent_2 = "Light List Accent 2"
-        Light_List_Accent_3 = "Light List Accent 3"
-        Light_List_Accent_4 = "Light List Accent 4"
-        Light_List_Accent_5 = "Light List Accent 5"
-        Light_List_Accent_6 = "Light List Accent 6"
-        Light_Grid = "Light Grid"
-        Light_Grid_Accent_1 = "Light Grid Accent 1"
-        Light_Grid_Accent_2 = "Light Grid Accent 2"
-        Light_Grid_Accent_3 = "Light Grid Accent 3"
-        Light_Grid_Accent_4 = "Light Grid Accent 4"
-        Light_Grid_Accent_5 = "Light Grid Accent 5"
-        Light_Grid_Accent_6 = "Light Grid Accent 6"
-        Medium_Shading_1 = "Medium Shading 1"
-        Medium_Shading_1_Accent_1 = "Medium Shading 1 Accent 1"
-        Medium_Shading_1_Accent_2 = "Medium Shading 1 Accent 2"
-        Medium_Shading_1_Accent_3 = "Medium Shading 1 Accent 3"
-        Medium_Shading_1_Accent_4 = "Medium Shading 1 Accent 4"
-        Medium_Shading_1_Accent_5 = "Medium Shading 1 Accent 5"
-        Medium_Shading_1_Accent_6 = "Medium Shading 1 Accent 6"
-        Medium_Shading_2 = "Medium Shading 2"
-        Medium_Shading_2_Accent_1 = "Medium Shading 2 Accent 1"
-        Medium_Shading_2_Accent_2 = "Medium Shading 2 Accent 2"
-        Medium_Shading_2_Accent_3 = "Medium Shading 2 Accent 3"
-        Medium_Shading_2_Accent_4 = "Medium Shading 2 Accent 4"
-        Medium_Shading_2_Accent_5 = "Medium Shading 2 Accent 5"
-        Medium_Shading_2_Accent_6 = "Medium Shading 2 Accent 6"
-        Medium_List_1 = "Medium List 1"
-        Medium_List_1_Accent_1 = "Medium List 1 Accent 1"
-        Medium_List_1_Accent_2 = "Medium List 1 Accent 2"
-        Medium_List_1_Accent_3 = "Medium List 1 Accent 3"
-        Medium_List_1_Accent_4 = "Medium List 1 Accent 4"
-        Medium_List_1_Accent_5 = "Medium List 1 Accent 5"
-        Medium_List_1_Accent_6 = "Medium List 1 Accent 6"
-        Medium_List_2 = "Medium List 2"
-        Medium_List_2_Accent_1 = "Medium List 2 Accent 1"
-        Medium_List_2_Accent_2 = "Medium List 2 Accent 2"
-        Medium_List_2_Accent_3 = "Medium List 2 Accent 3"
-        Medium_List_2_Accent_4 = "Medium List 2 Accent 4"
-        Medium_List_2_Accent_5 = "Medium List 2 Accent 5"
-        Medium_List_2_Accent_6 = "Medium List 2 Accent 6"
-        Medium_Grid_1 = "Medium Grid 1"
-        Medium_Grid_1_Accent_1 = "Medium Grid 1 Accent 1"
-        Medium_Grid_1_Accent_2 = "Medium Grid 1 Accent 2"
-        Medium_Grid_1_Accent_3 = "Medium Grid 1 Accent 3"
-        Medium_Grid_1_Accent_4 = "Medium Grid 1 Accent 4"
-        Medium_Grid_1_Accent_5 = "Medium Grid 1 Accent 5"
-        Medium_Grid_1_Accent_6 = "Medium Grid 1 Accent 6"
-        Medium_Grid_2 = "Medium Grid 2"
-        Medium_Grid_2_Accent_1 = "Medium Grid 2 Accent 1"
-        Medium_Grid_2_Accent_2 = "Medium Grid 2 Accent 2"
-        Medium_Grid_2_Accent_3 = "Medium Grid 2 Accent 3"
-        Medium_Grid_2_Accent_4 = "Medium Grid 2 Accent 4"
-        Medium_Grid_2_Accent_5 = "Medium Grid 2 Accent 5"
-        Medium_Grid_2_Accent_6 = "Medium Grid 2 Accent 6"
-        Medium_Grid_3 = "Medium Grid 3"
-        Medium_Grid_3_Accent_1 = "Medium Grid 3 Accent 1"
-        Medium_Grid_3_Accent_2 = "Medium Grid 3 Accent 2"
-        Medium_Grid_3_Accent_3 = "Medium Grid 3 Accent 3"
-        Medium_Grid_3_Accent_4 = "Medium Grid 3 Accent 4"
-        Medium_Grid_3_Accent_5 = "Medium Grid 3 Accent 5"
-        Medium_Grid_3_Accent_6 = "Medium Grid 3 Accent 6"
-        Dark_List = "Dark List"
-        Dark_List_Accent_1 = "Dark List Accent 1"
-        Dark_List_Accent_2 = "Dark List Accent 2"
-        Dark_List_Accent_3 = "Dark List Accent 3"
-        Dark_List_Accent_4 = "Dark List Accent 4"
-        Dark_List_Accent_5 = "Dark List Accent 5"
-        Dark_List_Accent_6 = "Dark List Accent 6"
-        Colorful_Shading = "Colorful Shading"
-        Colorful_Shading_Accent_1 = "Colorful Shading Accent 1"
-        Colorful_Shading_Accent_2 = "Colorful Shading Accent 2"
-        Colorful_Shading_Accent_3 = "Colorful Shading Accent 3"
-        Colorful_Shading_Accent_4 = "Colorful Shading Accent 4"
-        Colorful_Shading_Accent_5 = "Colorful Shading Accent 5"
-        Colorful_Shading_Accent_6 = "Colorful Shading Accent 6"
-        Colorful_List = "Colorful List"
-        Colorful_List_Accent_1 = "Colorful List Accent 1"
-        Colorful_List_Accent_2 = "Colorful List Accent 2"
-        Colorful_List_Accent_3 = "Colorful List Accent 3"
-        Colorful_List_Accent_4 = "Colorful List Accent 4"
-        Colorful_List_Accent_5 = "Colorful List Accent 5"
-        Colorful_List_Accent_6 = "Colorful List Accent 6"
-        Colorful_Grid = "Colorful Grid"
-        Colorful_Grid_Accent_1 = "Colorful Grid Accent 1"
-        Colorful_Grid_Accent_2 = "Colorful Grid Accent 2"
-        Colorful_Grid_Accent_3 = "Colorful Grid Accent 3"
-        Colorful_Grid_Accent_4 = "Colorful Grid Accent 4"
-        Colorful_Grid_Accent_5 = "Colorful Grid Accent 5"
-        Colorful_Grid_Accent_6 = "Colorful Grid Accent 6"
-
-    class TableStyle(object):
-        Normal_Table = "Normal Table"
-        Table_Grid = "Table Grid"
-        Light_Shading = "Light Shading"
-        Light_Shading_Accent_1 = "Light Shading Accent 1"
-        Light_Shading_Accent_2 = "Light Shading Accent 2"
-        Light_Shading_Accent_3 = "Light Shading Accent 3"
-        Light_Shading_Accent_4 = "Light Shading Accent 4"
-        Light_Shading_Accent_5 = "Light Shading Accent 5"
-        Light_Shading_Accent_6 = "Light Shading Accent 6"
-        Light_List = "Light List"
-        Light_List_Accent_1 = "Light List Accent 1"
-        Light_List_Accent_2 = "Light List Accent 2"
-        Light_List_Accent_3 = "Light List Accent 3"
-        Light_List_Accent_4 = "Light List Accent 4"
-        Light_List_Accent_5 = "Light List Accent 5"
-        Light_List_Accent_6 = "Light List Accent 6"
-        Light_Grid = "Light Grid"
-        Light_Grid_Accent_1 = "Light Grid Accent 1"
-        Light_Grid_Accent_2 = "Light Grid Accent 2"
-        Light_Grid_Accent_3 = "Light Grid Accent 3"
-        Light_Grid_Accent_4 = "Light Grid Accent 4"
-        Light_Grid_Accent_5 = "Light Grid Accent 5"
-        Light_Grid_Accent_6 = "Light Grid Accent 6"
-        Medium_Shading_1 = "Medium Shading 1"
-        Medium_Shading_1_Accent_1 = "Medium Shading 1 Accent 1"
-        Medium_Shading_1_Accent_2 = "Medium Shading 1 Accent 2"
-        Medium_Shading_1_Accent_3 = "Medium Shading 1 Accent 3"
-        Medium_Shading_1_Accent_4 = "Medium Shading 1 Accent 4"
-        Medium_Shading_1_Accent_5 = "Medium Shading 1 Accent 5"
-        Medium_Shading_1_Accent_6 = "Medium Shading 1 Accent 6"
-        Medium_Shading_2 = "Medium Shading 2"
-        Medium_Shading_2_Accent_1 = "Medium Shading 2 Accent 1"
-        Medium_Shading_2_Accent_2 = "Medium Shading 2 Accent 2"
-        Medium_Shading_2_Accent_3 = "Medium Shading 2 Accent 3"
-        Medium_Shading_2_Accent_4 = "Medium Shading 2 Accent 4"
-        Medium_Shading_2_Accent_5 = "Medium Shading 2 Accent 5"
-        Medium_Shading_2_Accent_6 = "Medium Shading 2 Accent 6"
-        Medium_List_1 = "Medium List 1"
-        Medium_List_1_Accent_1 = "Medium List 1 Accent 1"
-        Medium_List_1_Accent_2 = "Medium List 1 Accent 2"
-        Medium_List_1_Accent_3 = "Medium List 1 Accent 3"
-        Medium_List_1_Accent_4 = "Medium List 1 Accent 4"
-        Medium_List_1_Accent_5 = "Medium List 1 Accent 5"
-        Medium_List_1_Accent_6 = "Medium List 1 Accent 6"
-        Medium_List_2 = "Medium List 2"
-        Medium_List_2_Accent_1 = "Medium List 2 Accent 1"
-        Medium_List_2_Accent_2 = "Medium List 2 Accent 2"
-        Medium_List_2_Accent_3 = "Medium List 2 Accent 3"
-        Medium_List_2_Accent_4 = "Medium List 2 Accent 4"
-        Medium_List_2_Accent_5 = "Medium List 2 Accent 5"
-        Medium_List_2_Accent_6 = "Medium List 2 Accent 6"
-        Medium_Grid_1 = "Medium Grid 1"
-        Medium_Grid_1_Accent_1 = "Medium Grid 1 Accent 1"
-        Medium_Grid_1_Accent_2 = "Medium Grid 1 Accent 2"
-        Medium_Grid_1_Accent_3 = "Medium Grid 1 Accent 3"
-        Medium_Grid_1_Accent_4 = "Medium Grid 1 Accent 4"
-        Medium_Grid_1_Accent_5 = "Medium Grid 1 Accent 5"
-        Medium_Grid_1_Accent_6 = "Medium Grid 1 Accent 6"
-        Medium_Grid_2 = "Medium Grid 2"
-        Medium_Grid_2_Accent_1 = "Medium Grid 2 Accent 1"
-        Medium_Grid_2_Accent_2 = "Medium Grid 2 Accent 2"
-        Medium_Grid_2_Accent_3 = "Medium Grid 2 Accent 3"
-        Medium_Grid_2_Accent_4 = "Medium Grid 2 Accent 4"
-        Medium_Grid_2_Accent_5 = "Medium Grid 2 Accent 5"
-        Medium_Grid_2_Accent_6 = "Medium Grid 2 Accent 6"
-        Medium_Grid_3 = "Medium Grid 3"
-        Medium_Grid_3_Accent_1 = "Medium Grid 3 Accent 1"
-        Medium_Grid_3_Accent_2 = "Medium Grid 3 Accent 2"
-        Medium_Grid_3_Accent_3 = "Medium Grid 3 Accent 3"
-        Medium_Grid_3_Accent_4 = "Medium Grid 3 Accent 4"
-        Medium_Grid_3_Accent_5 = "Medium Grid 3 Accent 5"
-        Medium_Grid_3_Accent_6 = "Medium Grid 3 Accent 6"
-        Dark_List = "Dark List"
-        Dark_List_Accent_1 = "Dark List Accent 1"
-        Dark_List_Accent_2 = "Dark List Accent 2"
-        Dark_List_Accent_3 = "Dark List Accent 3"
-        Dark_List_Accent_4 = "Dark List Accent 4"
-        Dark_List_Accent_5 = "Dark List Accent 5"
-        Dark_List_Accent_6 = "Dark List Accent 6"
-        Colorful_Shading = "Colorful Shading"
-        Colorful_Shading_Accent_1 = "Colorful Shading Accent 1"
-        Colorful_Shading_Accent_2 = "Colorful Shading Accent 2"
-        Colorful_Shading_Accent_3 = "Colorful Shading Accent 3"
-        Colorful_Shading_Accent_4 = "Colorful Shading Accent 4"
-        Colorful_Shading_Accent_5 = "Colorful Shading Accent 5"
-        Colorful_Shading_Accent_6 = "Colorful Shading Accent 6"
-        Colorful_List = "Colorful List"
-        Colorful_List_Accent_1 = "Colorful List Accent 1"
-        Colorful_List_Accent_2 = "Colorful List Accent 2"
-        Colorful_List_Accent_3 = "Colorful List Accent 3"
-        Colorful_List_Accent_4 = "Colorful List Accent 4"
-        Colorful_List_Accent_5 = "Colorful List Accent 5"
-        Colorful_List_Accent_6 = "Colorful List Accent 6"
-        Colorful_Grid = "Colorful Grid"
-        Colorful_Grid_Accent_1 = "Colorful Grid Accent 1"
-        Colorful_Grid_Accent_2 = "Colorful Grid Accent 2"
-        Colorful_Grid_Accent_3 = "Colorful Grid Accent 3"
-        Colorful_Grid_Accent_4 = "Colorful Grid Accent 4"
-        Colorful_Grid_Accent_5 = "Colorful Grid Accent 5"
-        Colorful_Grid_Accent_6 = "Colorful Grid Accent 6"
+    ParagraphStyle = _style_name_class('ParagraphStyle', _PARAGRAPH_STYLE_NAMES)
+    TableStyle = _style_name_class('TableStyle', _TABLE_STYLE_NAMES)